@@ -1,7 +1,11 @@
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 from configs import Config, Pos
 
+if TYPE_CHECKING:
+    from quoridor_env import QuoridorEnv
+
 
 @dataclass
 class ActionSpace:
@@ -37,6 +41,51 @@ class ActionSpace:
     )
 
 
+# Flattened move tables, precomputed once at import so the per-turn move
+# generation iterates plain tuples instead of rebuilding dict views/lists.
+PLAYER_MOVES = tuple(
+    (name, idx, dy, dx)
+    for idx, (name, (dy, dx)) in enumerate(ActionSpace.player_movement.items())
+)
+# (dy, dx) -> (absolute action idx, name) for the blocked moves, so callers
+# resolve a delta with one dict lookup instead of a linear .index() scan.
+BLOCKED_MOVE_LOOKUP = {
+    (dy, dx): (ActionSpace.blocked_movement_idx_start + i, name)
+    for i, (name, (dy, dx)) in enumerate(ActionSpace.blocked_movement.items())
+}
+
+
+def _blocked_by_dir() -> dict:
+    """
+    Per facing direction (the unit step from player to opponent), everything
+    blocked-move generation needs: the jump entry and the two diagonal
+    entries, each as (idx, name, move_dy, move_dx, check_dy, check_dx) where
+    (check_dy, check_dx) is the edge to test from the opponent's square.
+    """
+    table = {}
+    for dy, dx in ActionSpace.player_movement.values():
+        jump_idx, jump_name = BLOCKED_MOVE_LOOKUP[(2 * dy, 2 * dx)]
+        jump = (jump_idx, jump_name, 2 * dy, 2 * dx)
+
+        diagonals = []
+        if dx:
+            # Opponent to the side: side-step diagonally up/down
+            for diagonal_dy in (-1, 1):
+                idx, name = BLOCKED_MOVE_LOOKUP[(diagonal_dy, dx)]
+                diagonals.append((idx, name, diagonal_dy, dx, diagonal_dy, 0))
+        else:
+            # Opponent above/below: side-step diagonally left/right
+            for diagonal_dx in (-1, 1):
+                idx, name = BLOCKED_MOVE_LOOKUP[(dy, diagonal_dx)]
+                diagonals.append((idx, name, dy, diagonal_dx, 0, diagonal_dx))
+
+        table[(dy, dx)] = (jump, tuple(diagonals))
+    return table
+
+
+BLOCKED_BY_DIR = _blocked_by_dir()
+
+
 # ---------- Action dataclasses ----------
 # three types of actions: MovementAction, BlockedMovementAction, WallAction
 @dataclass
@@ -50,21 +99,44 @@ class MovementAction(Action):
     dx: int
     dy: int
 
+    def apply(self, env: "QuoridorEnv") -> None:
+        env._execute_player_movement(self)
+
 
 @dataclass
 class BlockedMovementAction(Action):
     dx: int
     dy: int
 
+    def apply(self, env: "QuoridorEnv") -> None:
+        env._execute_player_movement(self)
+
 
-@dataclass
 class WallAction(Action):
-    edge1: Pos
-    edge2: Pos
+    """
+    Wall placement action.
 
-    def __post_init__(self):
-        # Automatically set the name based on the wall’s unique string ID
-        self.name = self.get_move_name()
+    Not a dataclass on purpose: wall enumeration constructs O(N^2) candidates
+    per rebuild, and the sorted-edges name string was the most expensive part
+    of that. The name is now derived lazily from the edges on first access.
+    """
+
+    def __init__(self, name: str, idx: int, edge1: Pos, edge2: Pos):
+        # `name` is kept in the signature for compatibility, but the real
+        # name is always derived from the edges (see the property below).
+        self.idx = idx
+        self.edge1 = edge1
+        self.edge2 = edge2
+        self._name = name or None
+
+    @property
+    def name(self) -> str:
+        if self._name is None:
+            self._name = self.get_move_name()
+        return self._name
+
+    def apply(self, env: "QuoridorEnv") -> None:
+        env._execute_wall_action(self)
 
     def get_move_name(self) -> str:
         """Return string rep"""
@@ -72,3 +144,15 @@ class WallAction(Action):
         e2 = tuple(sorted(self.edge2))
         edges_sorted = sorted([e1, e2])
         return f"{edges_sorted[0]}_{edges_sorted[1]}"
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not WallAction:
+            return NotImplemented
+        return (
+            self.idx == other.idx
+            and self.edge1 == other.edge1
+            and self.edge2 == other.edge2
+        )
+
+    def __repr__(self) -> str:
+        return f"WallAction(name={self.name!r}, idx={self.idx})"
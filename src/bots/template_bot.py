@@ -7,6 +7,12 @@ from graph_state import GraphState
 class QuoridorBot(ABC):
     """Abstract Class to follow for your own bot creationg"""
 
+    # Set this to True if your select_move is a pure function of the state
+    # (no randomness, no learning between moves): the environment may then
+    # replay your previous answer when the exact same position comes up
+    # again instead of calling you. Leave it False if you use randomness!
+    deterministic: bool = False
+
     # this will be initialised to either be player 1 (idx =0) thus start player,
     # or player 2 (idx = 1) you have a differnet start pos and goal pos
     def __init__(self, player_id: int):
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-from collections import deque
-from typing import Dict, List, Deque, Optional
+from typing import List
 
 import random
 
-from configs import Graph, Pos
+from configs import Pos
+from graph_algos import GoalRowBFS
 from graph_state import GraphState
 from bots.template_bot import QuoridorBot
 from action import Action, MovementAction, BlockedMovementAction
@@ -18,6 +18,8 @@ class WalkBot(QuoridorBot):
 
     def __init__(self, player_id: int) -> None:
         super().__init__(player_id)
+        # Shared goal-row BFS with its own reusable buffers
+        self._bfs = GoalRowBFS()
 
     @staticmethod
     def __str__() -> str:
@@ -25,46 +27,21 @@ class WalkBot(QuoridorBot):
 
     # ---------- BFS utilities ----------
 
-    @staticmethod
-    def _reconstruct_path(parent: Dict[Pos, Optional[Pos]], end: Pos) -> List[Pos]:
-        path: List[Pos] = [end]
-        cur = parent[end]
-        while cur is not None:
-            path.append(cur)
-            cur = parent[cur]
-        path.reverse()
-        return path
-
-    @staticmethod
-    def bfs_shortest_path_to_goal(graph: Graph, start: Pos, goal_y: int) -> List[Pos]:
+    def bfs_shortest_path_to_goal(
+        self, state: GraphState, start: Pos, goal_y: int
+    ) -> List[Pos]:
         """
         Find the shortest path from `start` to any node with y == goal_y.
         Returns a list of positions from start to goal (inclusive).
         Raises AssertionError if no path exists (should be impossible in valid Quoridor states).
         """
-        if start[0] == goal_y:
-            return [start]
-
-        queue: Deque[Pos] = deque([start])
-        parent: Dict[Pos, Optional[Pos]] = {start: None}
-        visited = {start}
-
-        while queue:
-            node = queue.popleft()
-
-            for nbr in graph.get(node, []):
-                if nbr in visited:
-                    continue
-                visited.add(nbr)
-                parent[nbr] = node
-
-                if len(nbr) > 1 and nbr[0] == goal_y:
-                    return WalkBot._reconstruct_path(parent, nbr)
-
-                queue.append(nbr)
-
-        # In a valid game state this should never happen.
-        raise AssertionError("Unreachable goal: game logic/state is inconsistent. walk_bot")
+        path = self._bfs.path_to_goal_row(state, start, goal_y)
+        if path is None:
+            # In a valid game state this should never happen.
+            raise AssertionError(
+                "Unreachable goal: game logic/state is inconsistent. walk_bot"
+            )
+        return path
 
 
     def reset(self):
@@ -76,12 +53,10 @@ class WalkBot(QuoridorBot):
         Choose a walking move that advances along a shortest path toward the goal row.
         Falls back to a random walking move if something unexpected happens.
         """
-        # Current position and goal row for this player
-        pos: Pos = tuple(
-            state.player_pos[self.player_id]
-        )  # y, x # type: ignore[assignment]
-        pos = (int(pos[0]), int(pos[1]))  # y, x
-        goal_y: int = int(state.goal_y[self.player_id])  # y
+        # Current position and goal row for this player. GraphState keeps
+        # player_pos as plain (y, x) int tuples, so no coercion is needed.
+        pos: Pos = state.player_pos[self.player_id]  # y, x
+        goal_y: int = state.goal_y[self.player_id]  # y
 
         # Only consider walking-type actions for this bot
         # If any blocked walking moves exist, play one immediately (random if multiple) #this is just to show the possibilities, this move is OP!
@@ -99,7 +74,7 @@ class WalkBot(QuoridorBot):
         if not walk_moves:
             return random.choice(legal_actions)
 
-        path = self.bfs_shortest_path_to_goal(state.graph, pos, goal_y)
+        path = self.bfs_shortest_path_to_goal(state, pos, goal_y)
 
         # First step along the shortest path
         next_step = path[1]
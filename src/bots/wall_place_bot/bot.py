@@ -1,61 +1,32 @@
-from collections import deque
 from math import inf
-from typing import Deque, Dict, List, Optional
-from configs import Graph, Pos
+from typing import List, Optional
+from configs import Pos
+from graph_algos import GoalRowBFS
 from graph_state import GraphState
 from bots.template_bot import QuoridorBot
 from action import Action, BlockedMovementAction, MovementAction, WallAction
 import random
-from copy import deepcopy
 
 
 class WallPlaceBot(QuoridorBot):
     def __init__(self, player_id: int):
         super().__init__(player_id)
+        # Shared goal-row BFS with its own reusable buffers
+        self._bfs = GoalRowBFS()
 
     @staticmethod
     def __str__() -> str:
         return "WallBot"
 
-    @staticmethod
-    def _reconstruct_path(parent: Dict[Pos, Optional[Pos]], end: Pos) -> List[Pos]:
-        path: List[Pos] = [end]
-        cur = parent[end]
-        while cur is not None:
-            path.append(cur)
-            cur = parent[cur]
-        path.reverse()
-        return path
-
-    @staticmethod
-    def bfs_shortest_path_to_goal(graph: Graph, start: Pos, goal_y: int) -> List[Pos]:
+    def bfs_shortest_path_to_goal(
+        self, state: GraphState, start: Pos, goal_y: int
+    ) -> Optional[List[Pos]]:
         """
         Find the shortest path from `start` to any node with y == goal_y.
-        Returns a list of positions from start to goal (inclusive).
-        Raises AssertionError if no path exists (should be impossible in valid Quoridor states).
+        Returns a list of positions from start to goal (inclusive), or None
+        if no path exists.
         """
-        if start[0] == goal_y:
-            return [start]
-
-        queue: Deque[Pos] = deque([start])
-        parent: Dict[Pos, Optional[Pos]] = {start: None}
-        visited = {start}
-
-        while queue:
-            node = queue.popleft()
-
-            for nbr in graph.get(node, []):
-                if nbr in visited:
-                    continue
-                visited.add(nbr)
-                parent[nbr] = node
-
-                if len(nbr) > 1 and nbr[0] == goal_y:
-                    return WallPlaceBot._reconstruct_path(parent, nbr)
-
-                queue.append(nbr)
-
-        return None
+        return self._bfs.path_to_goal_row(state, start, goal_y)
 
     def reset(self):
         return super().reset()
@@ -78,28 +49,55 @@ class WallPlaceBot(QuoridorBot):
 
         def path_len(gstate: GraphState, pos, goal) -> int:
             """Return shortest path length (nodes) or +inf if unreachable/empty."""
-            path = self.bfs_shortest_path_to_goal(gstate.graph, pos, goal)
+            path = self.bfs_shortest_path_to_goal(gstate, pos, goal)
             if not path:
                 return inf
             return len(path)
 
         # Current baseline
-        opp_len = path_len(state, opp_pos, opp_goal)
-        own_path = self.bfs_shortest_path_to_goal(state.graph, own_pos, own_goal)
+        opp_path = self.bfs_shortest_path_to_goal(state, opp_pos, opp_goal)
+        opp_len = len(opp_path) if opp_path else inf
+        own_path = self.bfs_shortest_path_to_goal(state, own_pos, own_goal)
         own_len = len(own_path) if own_path else inf
         diff = opp_len - own_len
 
+        # Edge sets of both baseline paths (both orientations). A wall that
+        # cuts no edge of a player's shortest path leaves that path intact,
+        # so the player's distance is unchanged and its BFS can be skipped.
+        def path_edge_set(path: Optional[List[Pos]]) -> set:
+            edges: set = set()
+            if path:
+                for a, b in zip(path, path[1:]):
+                    edges.add((a, b))
+                    edges.add((b, a))
+            return edges
+
+        opp_path_edges = path_edge_set(opp_path)
+        own_path_edges = path_edge_set(own_path)
+
         # ---------- Try to find a beneficial wall ----------
         best_wall: List[WallAction] = []
         best_improvement = 0  # new_diff - diff
 
         for candidate in wall_acts:
-            tmp = deepcopy(state)
-            # Assuming this applies the wall and keeps legality; it's from legal_actions
-            tmp.execute_wall_action(candidate)
+            e1 = (candidate.edge1[0], candidate.edge1[1])
+            e2 = (candidate.edge2[0], candidate.edge2[1])
+            cuts_opp = e1 in opp_path_edges or e2 in opp_path_edges
+            cuts_own = e1 in own_path_edges or e2 in own_path_edges
+
+            # Off-path walls change neither distance: zero improvement,
+            # nothing to measure.
+            if not cuts_opp and not cuts_own:
+                continue
 
-            new_opp_len = path_len(tmp, opp_pos, opp_goal)
-            new_own_len = path_len(tmp, own_pos, own_goal)
+            # Apply the wall on our copy of the state, measure, then undo:
+            # way cheaper than deep-copying the whole state per candidate
+            state.execute_wall_action(candidate)
+
+            new_opp_len = path_len(state, opp_pos, opp_goal) if cuts_opp else opp_len
+            new_own_len = path_len(state, own_pos, own_goal) if cuts_own else own_len
+
+            state.undo_wall_action(candidate)
 
             # If either side becomes unreachable (shouldn't happen for legal walls), skip it
             if new_opp_len is inf or new_own_len is inf:
@@ -123,13 +121,23 @@ class WallPlaceBot(QuoridorBot):
         # If we have a valid path and at least one step, follow it
         walk_moves = move_acts + blocked_move_acts
 
+        # One BFS from the goal row scores every destination; unreachable
+        # cells keep the sentinel N*N + 1 which acts like +inf below.
+        N = state.config.N
+        goal_dist = self._bfs.dists_from_goal_row(state, own_goal)
+
         best_move: List[Action] = []
         shortest_distance = inf
         for move in walk_moves:
             dx = move.dx
             dy = move.dy
             new_pos = (own_pos[0] + dy, own_pos[1] + dx)
-            distance = path_len(state, new_pos, own_goal)
+            # Guard against off-board destinations (e.g. when this bot is
+            # seated with a player_id other than its own): unreachable
+            if 0 <= new_pos[0] < N and 0 <= new_pos[1] < N:
+                distance = goal_dist[new_pos[0] * N + new_pos[1]] + 1
+            else:
+                distance = inf
             if distance < shortest_distance:
                 shortest_distance = distance
                 best_move = [move]
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Dict, List, Tuple
+from typing import Dict, Set, Tuple
 
 
 @dataclass
@@ -14,7 +14,7 @@ class Config:
 
 # Some used datatypes
 Pos = Tuple[int]
-Graph = Dict[Pos, List[Pos]]
+Graph = Dict[Pos, Set[Pos]]
 
 
 @dataclass
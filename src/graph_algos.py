@@ -0,0 +1,118 @@
+from typing import List, Optional
+
+from configs import Pos
+from graph_state import GraphState
+
+
+class GoalRowBFS:
+    """
+    Breadth-first search toward a goal row over the flat adjacency bitmask.
+
+    One tuned implementation shared by the bots, so improvements land once
+    instead of per bot. Each owner keeps its own instance: the search runs
+    over flat integer node ids (y * N + x) with preallocated visited/parent/
+    queue buffers reused across calls, sized on first use. The engine's own
+    reachability tests are bit-parallel flood fills inside GraphState and
+    stay there.
+    """
+
+    def __init__(self) -> None:
+        self._visited: Optional[bytearray] = None
+        self._visited_zero: bytes = b""
+        self._parent: List[int] = []
+        self._queue: List[int] = []
+
+    def _ensure_buffers(self, size: int) -> None:
+        if self._visited is None or len(self._visited) != size:
+            self._visited = bytearray(size)
+            self._visited_zero = bytes(size)
+            self._parent = [-1] * size
+            self._queue = [0] * size
+        else:
+            self._visited[:] = self._visited_zero  # single C-level clear
+
+    @staticmethod
+    def _reconstruct_path(parent: List[int], end: int, N: int) -> List[Pos]:
+        path: List[Pos] = []
+        cur = end
+        while cur != -1:
+            path.append((cur // N, cur % N))
+            cur = parent[cur]
+        path.reverse()
+        return path
+
+    def path_to_goal_row(
+        self, state: GraphState, start: Pos, goal_y: int
+    ) -> Optional[List[Pos]]:
+        """
+        Find the shortest path from `start` to any node with y == goal_y.
+        Returns a list of positions from start to goal (inclusive), or None
+        if no path exists. Every node enters the queue at most once, so the
+        N*N buffers always suffice.
+        """
+        if start[0] == goal_y:
+            return [start]
+
+        N = state.config.N
+        adj = state.adj_bits
+        start_id = start[0] * N + start[1]
+        goal_lo, goal_hi = goal_y * N, goal_y * N + N
+
+        self._ensure_buffers(N * N)
+        visited, parent, queue = self._visited, self._parent, self._queue
+        visited[start_id] = 1
+        parent[start_id] = -1
+        queue[0] = start_id
+        head, tail = 0, 1
+
+        while head < tail:
+            v = queue[head]
+            head += 1
+            bits = adj[v]
+            for dir_bit, nbr in ((1, v - N), (2, v + N), (4, v - 1), (8, v + 1)):
+                if bits & dir_bit and not visited[nbr]:
+                    visited[nbr] = 1
+                    parent[nbr] = v
+
+                    if goal_lo <= nbr < goal_hi:
+                        return self._reconstruct_path(parent, nbr, N)
+
+                    queue[tail] = nbr
+                    tail += 1
+
+        return None
+
+    def dists_from_goal_row(self, state: GraphState, goal_y: int) -> List[int]:
+        """
+        Distance (in edges) from every tile to the given goal row, via one
+        multi-source BFS seeded with the whole row. Answers a distance query
+        for every candidate destination at once. Unreachable tiles get
+        N*N + 1. The dist array doubles as the visited set.
+        """
+        N = state.config.N
+        adj = state.adj_bits
+        dist = [N * N + 1] * (N * N)
+
+        if len(self._queue) != N * N:
+            self._queue = [0] * (N * N)
+        queue = self._queue
+
+        tail = 0
+        for idx in range(goal_y * N, goal_y * N + N):
+            dist[idx] = 0
+            queue[tail] = idx
+            tail += 1
+
+        head = 0
+        while head < tail:
+            v = queue[head]
+            head += 1
+            next_dist = dist[v] + 1
+            bits = adj[v]
+            for dir_bit, nbr in ((1, v - N), (2, v + N), (4, v - 1), (8, v + 1)):
+                if bits & dir_bit and next_dist < dist[nbr]:
+                    dist[nbr] = next_dist
+                    queue[tail] = nbr
+                    tail += 1
+
+        return dist
@@ -1,12 +1,128 @@
 from dataclasses import dataclass, field
-from typing import List, Dict, Set
+from functools import lru_cache
+from typing import Dict, List, Set
+
+import numpy as np
 from colorama import Fore
-from collections import deque
 
 from action import ActionSpace, WallAction
 from configs import Config, Graph, Pos
 
 
+# Direction bits for the per-node adjacency bitmask: N / S / W / E of a tile
+_DIR_BITS = {(-1, 0): 1, (1, 0): 2, (0, -1): 4, (0, 1): 8}
+
+
+@lru_cache(maxsize=None)
+def _row_masks(N: int) -> tuple[int, ...]:
+    """Bitmask covering every tile of each row, precomputed per board size."""
+    return tuple(((1 << N) - 1) << (y * N) for y in range(N))
+
+
+@lru_cache(maxsize=None)
+def _wall_catalog(N: int) -> tuple[tuple, tuple]:
+    """
+    Complete catalog of wall actions for a board size, built once and shared
+    by every state. The edges are tuples, not lists, so a stray mutation
+    cannot corrupt the shared objects. Each entry is (wall, edge_mask,
+    slot_bit): the wall is placeable iff both bits of `edge_mask` are still
+    set on the matching open-edge bitboard and the perpendicular slot bit is
+    clear. Returns (horizontal, vertical) tuples.
+    """
+    horizontal = []
+    idx = ActionSpace.wall_horizontal_idx_start
+    for row in range(N - 1):
+        for col in range(N - 1):
+            bit = 1 << (row * N + col)
+            horizontal.append(
+                (
+                    WallAction(
+                        name="",  # derived lazily from the edges
+                        idx=idx,
+                        edge1=((row, col), (row + 1, col)),
+                        edge2=((row, col + 1), (row + 1, col + 1)),
+                    ),
+                    bit | (bit << 1),
+                    1 << (row * (N - 1) + col),
+                )
+            )
+            idx += 1
+
+    vertical = []
+    idx = ActionSpace.wall_vertical_idx_start
+    for row in range(N - 1):
+        for col in range(N - 1):
+            bit = 1 << (row * N + col)
+            vertical.append(
+                (
+                    WallAction(
+                        name="",  # derived lazily from the edges
+                        idx=idx,
+                        edge1=((row, col), (row, col + 1)),
+                        edge2=((row + 1, col), (row + 1, col + 1)),
+                    ),
+                    bit | (bit << N),
+                    1 << (row * (N - 1) + col),
+                )
+            )
+            idx += 1
+
+    return tuple(horizontal), tuple(vertical)
+
+
+@lru_cache(maxsize=None)
+def _base_bitboards(N: int) -> tuple[int, int, bytes]:
+    """
+    Open-edge bitboards and adjacency bitmask of a wall-free board, built
+    once per board size. Resets copy these instead of re-walking the grid.
+    """
+    open_south = 0
+    open_east = 0
+    adj_bits = bytearray(N * N)
+    for y in range(N):
+        for x in range(N):
+            bit = 1 << (y * N + x)
+            if y < N - 1:
+                open_south |= bit
+            if x < N - 1:
+                open_east |= bit
+
+            dir_bits = 0
+            if y > 0:
+                dir_bits |= 1  # north
+            if y < N - 1:
+                dir_bits |= 2  # south
+            if x > 0:
+                dir_bits |= 4  # west
+            if x < N - 1:
+                dir_bits |= 8  # east
+            adj_bits[y * N + x] = dir_bits
+    return open_south, open_east, bytes(adj_bits)
+
+
+@lru_cache(maxsize=None)
+def _base_graph(N: int) -> Graph:
+    """
+    Wall-free adjacency template, built once per board size. Fresh states
+    (new games, resets, copies for search) duplicate this instead of
+    re-deriving the 4-neighbourhood of every tile.
+    """
+    graph: Graph = {}
+    for y in range(N):
+        for x in range(N):
+            neighbors = set()
+            if y > 0:
+                neighbors.add((y - 1, x))
+            if y < N - 1:
+                neighbors.add((y + 1, x))
+            if x > 0:
+                neighbors.add((y, x - 1))
+            if x < N - 1:
+                neighbors.add((y, x + 1))
+            graph[(y, x)] = neighbors
+    return graph
+
+
 @dataclass(slots=True)
 class GraphState:
     """
@@ -27,6 +143,33 @@ class GraphState:
     # Each element is ((r1, c1), (r2, c2)) describing a wall segment
     placed_walls: Set[tuple[Pos, Pos]] = field(init=False)
 
+    # Placed-wall bitboards (bit index = row * (N - 1) + col of the wall's
+    # top-left slot). Crossing checks are a single bit test on these.
+    h_placed: int = field(init=False)
+    v_placed: int = field(init=False)
+
+    # Open-edge bitboards (bit index = y * N + x), kept in sync with `graph`.
+    # Bit set in open_south => edge between (y, x) and (y + 1, x) is open.
+    # Bit set in open_east  => edge between (y, x) and (y, x + 1) is open.
+    open_south: int = field(init=False)
+    open_east: int = field(init=False)
+
+    # Per-node direction bitmask (see _DIR_BITS), indexed by y * N + x.
+    # Mirrors `graph` but allows O(1) edge tests without hashing tuples.
+    adj_bits: bytearray = field(init=False)
+
+    # Cached distance-to-goal-row arrays, keyed by goal row.
+    # Only wall placements change these, so pawn moves keep the cache.
+    _goal_dist_cache: Dict[int, List[int]] = field(init=False)
+
+    # Cached geometrically legal walls (open edges, no crossing). Pawn moves
+    # never change this set, so it is only rebuilt after a wall placement.
+    _geom_walls_cache: List[WallAction] | None = field(init=False)
+
+    # Preallocated BFS queue (every node is enqueued at most once, so N*N
+    # slots always suffice); reused across calls instead of growing a list.
+    _bfs_queue: List[int] = field(init=False)
+
     def __post_init__(self) -> None:
         self._init_state()
 
@@ -43,53 +186,154 @@ class GraphState:
         self.walls_left = [B, B]
 
         self.placed_walls = set()
+        self.h_placed = 0
+        self.v_placed = 0
+        self._goal_dist_cache = {}
+        self._geom_walls_cache = None
+        self._bfs_queue = [0] * (N * N)
         self._construct_graph()
+        self._init_bitboards()
 
     def _construct_graph(self) -> None:
         """
-        Generate the base graph with all neighbouring tiles connected (no walls yet).
-        Each node is (row, col) and neighbours are its 4-neighbourhood.
+        Generate the base graph with all neighbouring tiles connected (no
+        walls yet) by copying the per-size module template. Each node is
+        (row, col) and neighbours are its 4-neighbourhood.
         """
-        N = self.config.N
-        self.graph = {}
-        for y in range(N):
-            for x in range(N):
-                neighbors = []
-                if y > 0:
-                    neighbors.append((y - 1, x))
-                if y < N - 1:
-                    neighbors.append((y + 1, x))
-                if x > 0:
-                    neighbors.append((y, x - 1))
-                if x < N - 1:
-                    neighbors.append((y, x + 1))
-                self.graph[(y, x)] = neighbors
+        self.graph = {
+            node: set(neighs) for node, neighs in _base_graph(self.config.N).items()
+        }
+
+    def _init_bitboards(self) -> None:
+        """
+        Set the open-edge bitboards and adjacency bitmask to the wall-free
+        board by copying the per-size module template: every tile connects to
+        its 4-neighbourhood except across the board borders.
+        """
+        self.open_south, self.open_east, adj_template = _base_bitboards(
+            self.config.N
+        )
+        self.adj_bits = bytearray(adj_template)
 
     def reset(self) -> None:
         """Reset the graph state to a new game."""
         self._init_state()
 
+    def copy(self) -> "GraphState":
+        """
+        Fast clone for handing to bots and search code: duplicates each
+        mutable container directly instead of deepcopy's generic object-graph
+        walk. Cached goal-distance lists and the geometric wall cache are
+        shared, which is safe because invalidation rebinds them rather than
+        mutating in place.
+        """
+        clone = object.__new__(GraphState)
+        clone.config = self.config
+        clone.graph = {node: set(neighs) for node, neighs in self.graph.items()}
+        clone.player_pos = list(self.player_pos)
+        clone.goal_y = list(self.goal_y)
+        clone.walls_left = list(self.walls_left)
+        clone.placed_walls = set(self.placed_walls)
+        clone.h_placed = self.h_placed
+        clone.v_placed = self.v_placed
+        clone.open_south = self.open_south
+        clone.open_east = self.open_east
+        clone.adj_bits = bytearray(self.adj_bits)
+        clone._goal_dist_cache = dict(self._goal_dist_cache)
+        clone._geom_walls_cache = self._geom_walls_cache
+        clone._bfs_queue = [0] * (self.config.N * self.config.N)
+        return clone
+
+    def __deepcopy__(self, memo) -> "GraphState":
+        # Generic deepcopy walks the object graph with memo bookkeeping;
+        # the field-wise clone is equivalent for this struct-like state
+        # (config is shared — it is never mutated) and much cheaper.
+        return self.copy()
+
+    def as_arrays(self) -> tuple:
+        """
+        NumPy rendering of the position for bots that prefer vectorised
+        logic: board int8[N, N] (0 empty, 1 player 0, 2 player 1),
+        hwalls/vwalls uint8[N-1, N-1] wall-slot occupancy, plus walls_left
+        and player positions as tuples. Built on demand from the bitboards
+        (the engine's source of truth), so these are snapshots to compute
+        with — mutating them does not touch the state.
+        """
+        N = self.config.N
+        board = np.zeros((N, N), dtype=np.int8)
+        board[self.player_pos[0]] = 1
+        board[self.player_pos[1]] = 2
+
+        slots = (N - 1) * (N - 1)
+        hwalls = np.fromiter(
+            ((self.h_placed >> i) & 1 for i in range(slots)),
+            dtype=np.uint8,
+            count=slots,
+        ).reshape(N - 1, N - 1)
+        vwalls = np.fromiter(
+            ((self.v_placed >> i) & 1 for i in range(slots)),
+            dtype=np.uint8,
+            count=slots,
+        ).reshape(N - 1, N - 1)
+
+        return board, hwalls, vwalls, tuple(self.walls_left), tuple(self.player_pos)
+
+    def state_key(self) -> tuple:
+        """
+        Compact, hashable summary of the position. The placed-wall bitboards
+        fully determine board connectivity, so together with the pawns and
+        remaining walls this identifies the position — handy as a key for
+        transposition tables / memoisation in search bots.
+        """
+        return (
+            self.h_placed,
+            self.v_placed,
+            self.player_pos[0],
+            self.player_pos[1],
+            self.walls_left[0],
+            self.walls_left[1],
+        )
+
+    def __hash__(self) -> int:
+        return hash(self.state_key())
+
     # ---------- Graph / wall queries ----------
 
     def is_edge(self, pos1: Pos, pos2: Pos) -> bool:
         """
         Return True if two tiles are connected (i.e., there is no wall blocking).
+        O(1) bit test on the adjacency bitmask; no tuple hashing or list scan.
         """
-        return pos2 in self.graph.get(pos1, [])
+        y, x = pos1
+        N = self.config.N
+        if not (0 <= y < N and 0 <= x < N):
+            return False
+
+        dir_bit = _DIR_BITS.get((pos2[0] - y, pos2[1] - x))
+        if dir_bit is None:
+            # Not a unit step; fall back to the adjacency dict
+            return pos2 in self.graph.get(pos1, [])
+        return bool(self.adj_bits[y * N + x] & dir_bit)
 
     @staticmethod
     def remove_connection(graph: Graph, pos1: Pos, pos2: Pos) -> None:
         """
         Remove an undirected connection between pos1 and pos2 from the given graph.
-        Works both for list-based and set-based adjacency.
+        Works both for set-based (discard) and list-based adjacency.
         """
         neighbors1 = graph.get(pos1)
-        if neighbors1 is not None and pos2 in neighbors1:
-            neighbors1.remove(pos2)
+        if neighbors1 is not None:
+            if isinstance(neighbors1, set):
+                neighbors1.discard(pos2)
+            elif pos2 in neighbors1:
+                neighbors1.remove(pos2)
 
         neighbors2 = graph.get(pos2)
-        if neighbors2 is not None and pos1 in neighbors2:
-            neighbors2.remove(pos1)
+        if neighbors2 is not None:
+            if isinstance(neighbors2, set):
+                neighbors2.discard(pos1)
+            elif pos1 in neighbors2:
+                neighbors2.remove(pos1)
 
     # ---------- Wall placement logic ----------
 
@@ -100,12 +344,7 @@ class GraphState:
         - wall does not cross another wall
         - wall does not completely block a player's path to their goal row
         """
-        if not self.is_edge(wall.edge1[0], wall.edge1[1]) or not self.is_edge(
-            wall.edge2[0], wall.edge2[1]
-        ):
-            return False
-
-        if self._wall_is_crossed(wall):
+        if not self._wall_geometry_ok(wall):
             return False
 
         if self._wall_blocks_any_player(wall):
@@ -113,6 +352,17 @@ class GraphState:
 
         return True
 
+    def _wall_geometry_ok(self, wall: WallAction) -> bool:
+        """
+        Pawn-independent legality: both edges still open and no crossing.
+        """
+        if not self.is_edge(wall.edge1[0], wall.edge1[1]) or not self.is_edge(
+            wall.edge2[0], wall.edge2[1]
+        ):
+            return False
+
+        return not self._wall_is_crossed(wall)
+
     def execute_wall_action(self, action: WallAction) -> None:
         """
         Place a wall in the current state:
@@ -128,101 +378,296 @@ class GraphState:
         self.placed_walls.add((edge1[0], edge1[1]))
         self.placed_walls.add((edge2[0], edge2[1]))
 
-    def _wall_is_crossed(self, new_wall: WallAction) -> bool:
+        # Mark the occupied wall slot on the placed-wall bitboards
+        is_horizontal, row, col = self._wall_slot(action)
+        slot_bit = 1 << (row * (self.config.N - 1) + col)
+        if is_horizontal:
+            self.h_placed |= slot_bit
+        else:
+            self.v_placed |= slot_bit
+
+        # Board connectivity changed, so the cached distances and the
+        # cached geometric wall list are stale
+        self._goal_dist_cache.clear()
+        self._geom_walls_cache = None
+
+        # Keep the open-edge bitboards and adjacency bitmask in sync
+        N = self.config.N
+        for a, b in (edge1, edge2):
+            south_bit, east_bit = self._edge_bits((a, b))
+            self.open_south &= ~south_bit
+            self.open_east &= ~east_bit
+
+            self.adj_bits[a[0] * N + a[1]] &= ~_DIR_BITS[(b[0] - a[0], b[1] - a[1])]
+            self.adj_bits[b[0] * N + b[1]] &= ~_DIR_BITS[(a[0] - b[0], a[1] - b[1])]
+
+    def _edge_bits(self, edge) -> tuple[int, int]:
         """
-        Check whether `new_wall` would cross an existing wall.
-        We do this by reconstructing the two 'crossing' segments and checking
-        if they're in placed_walls.
+        Return the (south_bit, east_bit) bitboard masks for a unit edge;
+        exactly one of the two is non-zero.
+        """
+        (y1, x1), (y2, x2) = edge
+        if (y1, x1) > (y2, x2):
+            y1, x1, y2, x2 = y2, x2, y1, x1
+
+        bit = 1 << (y1 * self.config.N + x1)
+        if y2 == y1 + 1:
+            return bit, 0  # vertical neighbours -> south edge
+        return 0, bit  # horizontal neighbours -> east edge
 
-        For a horizontal vs vertical crossing, the placed segments are exactly:
-        ((p1, p3), (p2, p4)) where:
-          - new_wall.edge1 = [p1, p2]
-          - new_wall.edge2 = [p3, p4]
+    def undo_wall_action(self, action: WallAction) -> None:
+        """
+        Revert a wall placed with execute_wall_action: re-add both edges,
+        restore the bitboards and drop the wall's segments and slot bit.
+        Lets search bots explore candidate walls with apply/undo instead of
+        copying the whole state per candidate.
         """
-        edge_1, edge_2 = new_wall.edge1, new_wall.edge2
-        p1, p2 = edge_1[0], edge_1[1]
-        p3, p4 = edge_2[0], edge_2[1]
+        edge1, edge2 = action.edge1, action.edge2
+
+        N = self.config.N
+        for a, b in (edge1, edge2):
+            self.graph[a].add(b)
+            self.graph[b].add(a)
+
+            south_bit, east_bit = self._edge_bits((a, b))
+            self.open_south |= south_bit
+            self.open_east |= east_bit
 
-        crossed_seg1 = (p1, p3)
-        crossed_seg2 = (p2, p4)
+            self.adj_bits[a[0] * N + a[1]] |= _DIR_BITS[(b[0] - a[0], b[1] - a[1])]
+            self.adj_bits[b[0] * N + b[1]] |= _DIR_BITS[(a[0] - b[0], a[1] - b[1])]
 
-        return crossed_seg1 in self.placed_walls and crossed_seg2 in self.placed_walls
+        self.placed_walls.discard((edge1[0], edge1[1]))
+        self.placed_walls.discard((edge2[0], edge2[1]))
+
+        is_horizontal, row, col = self._wall_slot(action)
+        slot_bit = 1 << (row * (N - 1) + col)
+        if is_horizontal:
+            self.h_placed &= ~slot_bit
+        else:
+            self.v_placed &= ~slot_bit
+
+        # Connectivity changed again, so the caches are stale
+        self._goal_dist_cache.clear()
+        self._geom_walls_cache = None
+
+    @staticmethod
+    def _wall_slot(wall: WallAction) -> tuple[bool, int, int]:
+        """
+        Return (is_horizontal, row, col) for the wall's top-left slot.
+        A horizontal wall connects vertically adjacent tiles (its edges
+        cross a row boundary), a vertical wall the other way around.
+        """
+        (y1, x1), (y2, x2) = wall.edge1
+        (y3, x3), (y4, x4) = wall.edge2
+        return y1 != y2, min(y1, y2, y3, y4), min(x1, x2, x3, x4)
+
+    def _wall_is_crossed(self, new_wall: WallAction) -> bool:
+        """
+        Check whether `new_wall` would cross an existing wall. Only the
+        perpendicular wall occupying the same slot can cross, so this is a
+        single bit test on the placed-wall bitboards.
+        """
+        is_horizontal, row, col = self._wall_slot(new_wall)
+        slot_bit = 1 << (row * (self.config.N - 1) + col)
+        if is_horizontal:
+            return bool(self.v_placed & slot_bit)
+        return bool(self.h_placed & slot_bit)
 
     def _wall_blocks_any_player(self, new_wall: WallAction) -> bool:
         """
-        Simulate placing this wall and check if *any* player loses all paths
+        Check if placing this wall would leave *any* player without a path
         to their goal row.
-        """
-        # Make a shallow copy of the adjacency structure
-        graph_copy: Dict[Pos, set] = {
-            node: set(neighs) for node, neighs in self.graph.items()
-        }
 
-        # Remove adjacencies for both segments of the new wall
-        a1, b1 = new_wall.edge1
-        a2, b2 = new_wall.edge2
-        self.remove_connection(graph_copy, a1, b1)
-        self.remove_connection(graph_copy, a2, b2)
-
-        def can_reach_goal_row(start: Pos, goal_row: int) -> bool:
-            """BFS to check reachability to any node with row == goal_row."""
-            start = tuple(start)
-            visited = {start}
-            queue = deque([start])
-
-            while queue:
-                node = queue.popleft()
-                r, _ = node
-                if r == goal_row:
-                    return True
-                for nb in graph_copy.get(node, []):
-                    if nb not in visited:
-                        visited.add(nb)
-                        queue.append(nb)
+        Works on the open-edge bitboards: clear the two candidate edges in
+        local copies (plain ints, so no graph copy at all) and flood fill.
+        """
+        N = self.config.N
+        (a1, b1), (a2, b2) = new_wall.edge1, new_wall.edge2
+        i1, j1 = a1[0] * N + a1[1], b1[0] * N + b1[1]
+        i2, j2 = a2[0] * N + a2[1], b2[0] * N + b2[1]
+
+        need_check = [
+            (pos, goal)
+            for pos, goal in zip(self.player_pos, self.goal_y)
+            if self._might_block(goal, i1, j1, i2, j2)
+        ]
+        if not need_check:
             return False
 
-        for pos, goal in zip(self.player_pos, self.goal_y):
-            if not can_reach_goal_row(start=(pos[0], pos[1]), goal_row=goal):
-                return True
+        open_south, open_east = self.open_south, self.open_east
+        for edge in (new_wall.edge1, new_wall.edge2):
+            south_bit, east_bit = self._edge_bits(edge)
+            open_south &= ~south_bit
+            open_east &= ~east_bit
 
-        return False
+        if len(need_check) == 1:
+            pos, goal = need_check[0]
+            return not self._reachable(pos, goal, open_south, open_east)
 
-    def get_all_wall_moves(self) -> List[WallAction]:
+        # Both players need re-checking: flood the full closure around the
+        # first player once, and reuse it for the second player whenever the
+        # pawns share a region (almost always), instead of flooding twice.
+        (pos0, goal0), (pos1, goal1) = need_check
+        row_masks = _row_masks(N)
+
+        closure = self._flood_closure(pos0, open_south, open_east)
+        if not closure & row_masks[goal0]:
+            return True
+
+        if closure >> (pos1[0] * N + pos1[1]) & 1:
+            return not closure & row_masks[goal1]
+
+        return not self._reachable(pos1, goal1, open_south, open_east)
+
+    def _flood_closure(self, start: Pos, open_south: int, open_east: int) -> int:
         """
-        Return all legal wall placement moves for the current state.
+        Flood fill from `start` to the full fixed point (no early exit) and
+        return the visited mask, so one fill can answer several queries.
+        """
+        N = self.config.N
+        seen = 1 << (start[0] * N + start[1])
+        while True:
+            neighbours = (
+                ((seen & open_south) << N)
+                | ((seen >> N) & open_south)
+                | ((seen & open_east) << 1)
+                | ((seen >> 1) & open_east)
+            )
+            grown = seen | neighbours
+            if grown == seen:
+                return seen
+            seen = grown
+
+    def _might_block(self, goal_row: int, i1: int, j1: int, i2: int, j2: int) -> bool:
         """
-        wall_moves: List[WallAction] = []
+        Cheap necessary condition for a wall (given by its edge endpoint ids)
+        to cut off the player heading for goal_row: one of its edges must lie
+        on a shortest path to that row, i.e. the endpoint distances differ
+        by exactly 1. Uses the cached goal-distance arrays, so it is O(1).
+        """
+        dist = self._dist_to_goal_row(goal_row)
+        return abs(dist[i1] - dist[j1]) == 1 or abs(dist[i2] - dist[j2]) == 1
+
+    def _dist_to_goal_row(self, goal_row: int) -> List[int]:
+        """
+        Distance from every tile to the given goal row, computed with one
+        multi-source BFS seeded with the whole row. Cached until the next
+        wall placement (pawn moves don't change connectivity).
+        Unreachable tiles get N*N + 1.
+        """
+        dist = self._goal_dist_cache.get(goal_row)
+        if dist is not None:
+            return dist
 
         N = self.config.N
+        dist = [N * N + 1] * (N * N)
+
+        # Flat BFS over integer node ids (y * N + x): the dist array doubles
+        # as the visited set and the queue is the preallocated buffer driven
+        # by head/tail indices, so the loop never allocates.
+        queue = self._bfs_queue
+        tail = 0
+        for idx in range(goal_row * N, goal_row * N + N):
+            dist[idx] = 0
+            queue[tail] = idx
+            tail += 1
+
+        adj = self.adj_bits
+        head = 0
+        while head < tail:
+            v = queue[head]
+            head += 1
+            next_dist = dist[v] + 1
+            bits = adj[v]
+            if bits & 1 and next_dist < dist[v - N]:  # north
+                dist[v - N] = next_dist
+                queue[tail] = v - N
+                tail += 1
+            if bits & 2 and next_dist < dist[v + N]:  # south
+                dist[v + N] = next_dist
+                queue[tail] = v + N
+                tail += 1
+            if bits & 4 and next_dist < dist[v - 1]:  # west
+                dist[v - 1] = next_dist
+                queue[tail] = v - 1
+                tail += 1
+            if bits & 8 and next_dist < dist[v + 1]:  # east
+                dist[v + 1] = next_dist
+                queue[tail] = v + 1
+                tail += 1
+
+        self._goal_dist_cache[goal_row] = dist
+        return dist
+
+    def _reachable(
+        self, start: Pos, goal_row: int, open_south: int, open_east: int
+    ) -> bool:
+        """
+        Bit-parallel flood fill: expand the visited mask one step in all four
+        directions per round (shift + mask against the open edges) until we
+        touch the goal row or reach a fixed point. Pure integer ops, so the
+        whole reachability check runs inside C-level bigint arithmetic.
+        """
+        N = self.config.N
+        goal_mask = _row_masks(N)[goal_row]
+
+        seen = 1 << (start[0] * N + start[1])
+        if seen & goal_mask:
+            return True
+
+        while True:
+            neighbours = (
+                ((seen & open_south) << N)  # step south
+                | ((seen >> N) & open_south)  # step north
+                | ((seen & open_east) << 1)  # step east
+                | ((seen >> 1) & open_east)  # step west
+            )
+            grown = seen | neighbours
+            if grown & goal_mask:
+                return True
+            if grown == seen:
+                return False
+            seen = grown
 
-        # Horizontal walls
-        idx = ActionSpace.wall_horizontal_idx_start
-        for row_idx in range(N - 1):
-            for col_idx in range(N - 1):
-                action = WallAction(
-                    name="",  # filled by __post_init__ of WallAction
-                    idx=idx,
-                    edge1=[(row_idx, col_idx), (row_idx + 1, col_idx)],
-                    edge2=[(row_idx, col_idx + 1), (row_idx + 1, col_idx + 1)],
-                )
-                if self.possible_wall(action):
-                    wall_moves.append(action)
-                idx += 1
-
-        # Vertical walls
-        idx = ActionSpace.wall_vertical_idx_start
-        for row_idx in range(N - 1):
-            for col_idx in range(N - 1):
-                action = WallAction(
-                    name="",  # filled by __post_init__ of WallAction
-                    idx=idx,
-                    edge1=[(row_idx, col_idx), (row_idx, col_idx + 1)],
-                    edge2=[(row_idx + 1, col_idx), (row_idx + 1, col_idx + 1)],
-                )
-                if self.possible_wall(action):
-                    wall_moves.append(action)
-                idx += 1
+    def get_all_wall_moves(self) -> List[WallAction]:
+        """
+        Return all legal wall placement moves for the current state.
 
+        The geometric survivors (open edges, no crossing) are cached across
+        pawn moves and only rebuilt after a wall placement; the path-blocking
+        predicate depends on pawn positions, so it is re-checked every call.
+        """
+        if self._geom_walls_cache is None:
+            self._geom_walls_cache = self._enumerate_geometric_walls()
+
+        return [
+            wall
+            for wall in self._geom_walls_cache
+            if not self._wall_blocks_any_player(wall)
+        ]
+
+    def _enumerate_geometric_walls(self) -> List[WallAction]:
+        """
+        Filter the per-size wall catalog down to the geometrically placeable
+        walls. The catalog is built once per board size, so surviving slots
+        cost two bit tests and blocked slots one — no objects are constructed.
+        """
+        h_catalog, v_catalog = _wall_catalog(self.config.N)
+        open_south, open_east = self.open_south, self.open_east
+        h_placed, v_placed = self.h_placed, self.v_placed
+
+        # Horizontal walls: need both south edges open and no crossing
+        # vertical wall occupying the same slot, and vice versa
+        wall_moves = [
+            wall
+            for wall, edge_mask, slot_bit in h_catalog
+            if open_south & edge_mask == edge_mask and not v_placed & slot_bit
+        ]
+        wall_moves.extend(
+            wall
+            for wall, edge_mask, slot_bit in v_catalog
+            if open_east & edge_mask == edge_mask and not h_placed & slot_bit
+        )
         return wall_moves
 
     # ---------- Drawing ----------
@@ -234,31 +679,38 @@ class GraphState:
         """
         print("\033[H\033[J", end="")  # Clear-ish screen kinda cool tbh
 
+        # Bind colours once; attribute lookups on colorama's proxy add up
+        # over the O(N^2) cells
+        white, red, reset = Fore.WHITE, Fore.RED, Fore.RESET
+        green, cyan = Fore.GREEN, Fore.CYAN
+        open_bar, wall_bar = white + "─ ", red + "─ "
+
         def _print_horizontal_bars(r_idx: int) -> None:
-            horizontal_string = ""
-            for c_idx in range(self.config.N):
-                if (r_idx + 1, c_idx) in self.graph.get((r_idx, c_idx), []):
-                    color = Fore.WHITE
-                else:
-                    color = Fore.RED
-                horizontal_string += color + "─ "
-            print(horizontal_string + Fore.RESET)
+            bars = [
+                open_bar
+                if (r_idx + 1, c_idx) in self.graph.get((r_idx, c_idx), [])
+                else wall_bar
+                for c_idx in range(self.config.N)
+            ]
+            print("".join(bars) + reset)
 
         def _print_vertical_bar(r_idx: int, c_idx: int, end: str = "") -> None:
             if (r_idx, c_idx + 1) in self.graph.get((r_idx, c_idx), []):
-                color = Fore.WHITE
+                color = white
             else:
-                color = Fore.RED
-            print(color + "│" + Fore.RESET, end=end)
+                color = red
+            print(color + "│" + reset, end=end)
+
+        p0_pos, p1_pos = self.player_pos
 
         def _print_cell(r_idx: int, c_idx: int) -> None:
             pos = (r_idx, c_idx)
-            if pos == self.player_pos[0]:
-                print(Fore.GREEN + "X", end="")
-            elif pos == self.player_pos[1]:
-                print(Fore.CYAN + "X", end="")
+            if pos == p0_pos:
+                print(green + "X", end="")
+            elif pos == p1_pos:
+                print(cyan + "X", end="")
             else:
-                print(Fore.WHITE + " ", end="")
+                print(white + " ", end="")
 
         def _print_vertical_and_cells(r_idx: int) -> None:
             for c_idx in range(self.config.N - 1):
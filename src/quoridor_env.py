@@ -2,7 +2,7 @@ import time
 from typing import List
 
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
-from copy import deepcopy
+from copy import copy
 
 from bots.template_bot import QuoridorBot
 from configs import Config
@@ -13,6 +13,8 @@ from action import (
     BlockedMovementAction,
     MovementAction,
     WallAction,
+    PLAYER_MOVES,
+    BLOCKED_BY_DIR,
 )
 
 
@@ -20,6 +22,10 @@ class QuoridorEnv:
     """
     Game environment for Quoridor.
 
+    MOVE_CACHE_MAX bounds the deterministic-bot transposition cache; when
+    full it is simply cleared (positions repeat mostly within/between
+    consecutive games, so old entries are cheap to lose).
+
     Responsibilities:
     - Maintain whose turn it is
     - Ask GraphState for legal actions
@@ -29,6 +35,8 @@ class QuoridorEnv:
     - Game Loop! while capturing
     """
 
+    MOVE_CACHE_MAX = 1 << 16
+
     def __init__(self) -> None:
         self.s = Config()
 
@@ -37,7 +45,11 @@ class QuoridorEnv:
 
         self.running: bool = True
         self.turn: int = 1
-        self.to_move: int = self.s.P1  # start with player 1 by default
+        self.to_move = self.s.P1  # start with player 1 by default
+
+        # Transposition cache for bots that declare themselves deterministic:
+        # (bot, mover, position) -> previously chosen action idx
+        self._move_cache: dict = {}
 
     def reset(self) -> None:
         self.state.reset()
@@ -45,6 +57,17 @@ class QuoridorEnv:
         self.running = True
         self.to_move = self.s.P1
 
+    @property
+    def to_move(self) -> int:
+        return self._to_move
+
+    @to_move.setter
+    def to_move(self, player: int) -> None:
+        # Cache the mover's goal row alongside, so check_win is a single
+        # compare instead of two chained index lookups
+        self._to_move = player
+        self._goal_row = self.state.goal_y[player]
+
     # ---------- Legal move generation ----------
 
     def _get_player_movement_actions(
@@ -54,20 +77,16 @@ class QuoridorEnv:
         Return all legal pawn movement actions (normal + blocked moves) for the player to move.
         """
         actions: List[MovementAction | BlockedMovementAction] = []
-        y, x = self.state.player_pos[self.to_move]
-
-        for idx, (name, movement) in enumerate(
-            self.action_space.player_movement.items()
-        ):
-            dy, dx = movement
+        y, x = self.state.player_pos[self._to_move]
+        opponent_pos = self.state.player_pos[1 - self._to_move]
 
+        for name, idx, dy, dx in PLAYER_MOVES:
             # Edge must exist (no wall in between, and on-board)
             if not self.state.is_edge((y, x), (y + dy, x + dx)):
                 continue
 
             # Opponent directly in the way -> special 'blocked' moves (jump / diagonals)
-            opponent = 1 - self.to_move
-            if (y + dy, x + dx) == self.state.player_pos[opponent]:
+            if (y + dy, x + dx) == opponent_pos:
                 actions.extend(self._get_player_blocked_actions())
                 continue
 
@@ -80,88 +99,60 @@ class QuoridorEnv:
         Retrieve all special (blocked) moves when the pawn is directly facing the opponent.
         Assumes the edge between player and opponent is valid.
         """
-        player_pos = self.state.player_pos[self.to_move]
-        opponent_pos = self.state.player_pos[1 - self.to_move]
+        player_pos = self.state.player_pos[self._to_move]
+        opponent_pos = self.state.player_pos[1 - self._to_move]
 
         dy = opponent_pos[0] - player_pos[0]
         dx = opponent_pos[1] - player_pos[1]
 
-        blocked_moves: List[BlockedMovementAction] = []
-        jump_dy, jump_dx = 2 * dy, 2 * dx
-
-        moves_vals = list(ActionSpace.blocked_movement.values())
-        moves_keys = list(ActionSpace.blocked_movement.keys())
-        start_idx = ActionSpace.blocked_movement_idx_start
+        # All deltas for this facing direction come precomputed
+        jump, diagonals = BLOCKED_BY_DIR[(dy, dx)]
 
         # ----- Jumping move -----
+        # If the jump is possible, diagonals are not allowed
+        jump_idx, jump_name, jump_dy, jump_dx = jump
         if self.state.is_edge(
             pos1=opponent_pos,
             pos2=(player_pos[0] + jump_dy, player_pos[1] + jump_dx),
         ):
-            # This (jump_dy, jump_dx) should be in blocked_movement, kinda cool logic
-            idx = moves_vals.index((jump_dy, jump_dx))
-            jump_move = BlockedMovementAction(
-                name=moves_keys[idx],
-                idx=start_idx + idx,
-                dx=jump_dx,
-                dy=jump_dy,
-            )
-            blocked_moves.append(jump_move)
-
-        # If jump is possible, diagonals are not allowed
-        if blocked_moves:
-            return blocked_moves
-
-        # ----- Diagonal moves -----
-        diagonal_dys = [-1, 1] if dx else []
-        diagonal_dxs = [-1, 1] if dy else []
-
-        # Diagonal in Y direction (side steps up/down)
-        for diagonal_dy in diagonal_dys:
-            # Move (diagonal_dy, dx), still blocked_movement by design
-            idx = moves_vals.index((diagonal_dy, dx))
-            if self.state.is_edge(
-                opponent_pos, (opponent_pos[0] + diagonal_dy, opponent_pos[1])
-            ):
-                diagonal_move = BlockedMovementAction(
-                    name=moves_keys[idx],
-                    idx=start_idx + idx,
-                    dx=dx,
-                    dy=diagonal_dy,
+            return [
+                BlockedMovementAction(
+                    name=jump_name,
+                    idx=jump_idx,
+                    dx=jump_dx,
+                    dy=jump_dy,
                 )
-                blocked_moves.append(diagonal_move)
+            ]
 
-        # Diagonal in X direction (side steps left/right)
-        for diagonal_dx in diagonal_dxs:
-            idx = moves_vals.index((dy, diagonal_dx))
+        # ----- Diagonal moves (side steps around the opponent) -----
+        blocked_moves: List[BlockedMovementAction] = []
+        for idx, name, move_dy, move_dx, check_dy, check_dx in diagonals:
             if self.state.is_edge(
-                opponent_pos, (opponent_pos[0], opponent_pos[1] + diagonal_dx)
+                opponent_pos,
+                (opponent_pos[0] + check_dy, opponent_pos[1] + check_dx),
             ):
-                diagonal_move = BlockedMovementAction(
-                    name=moves_keys[idx],
-                    idx=start_idx + idx,
-                    dx=diagonal_dx,
-                    dy=dy,
+                blocked_moves.append(
+                    BlockedMovementAction(
+                        name=name,
+                        idx=idx,
+                        dx=move_dx,
+                        dy=move_dy,
+                    )
                 )
-                blocked_moves.append(diagonal_move)
 
         return blocked_moves
 
-    def _get_wall_actions(self) -> List[WallAction]:
-        """
-        Return all legal wall actions for the player to move, considering remaining walls.
-        """
-        if not self.state.walls_left[self.to_move]:
-            return []
-        return self.state.get_all_wall_moves()
-
     def get_all_legal_actions(self) -> List[Action]:
         """
         Get all legal actions (movement + wall placement) for the player to move.
         """
-        return list(self._get_player_movement_actions()) + list(
-            self._get_wall_actions()
-        )
+        moves: List[Action] = self._get_player_movement_actions()
+        if not self.state.walls_left[self._to_move]:
+            # No walls left (common for the whole endgame): the movement
+            # list is already a fresh list, return it without re-copying
+            return moves
+        moves.extend(self.state.get_all_wall_moves())
+        return moves
 
     # ---------- Rule application ----------
 
@@ -169,8 +160,7 @@ class QuoridorEnv:
         """
         Check if the player to move has reached their goal row.
         """
-        player_row = self.state.player_pos[self.to_move][0]
-        if self.state.goal_y[self.to_move] == player_row:
+        if self.state.player_pos[self._to_move][0] == self._goal_row:
             self.running = False
             return True
         return False
@@ -181,26 +171,25 @@ class QuoridorEnv:
         """
         Apply a movement to the current player.
         """
-        y, x = self.state.player_pos[self.to_move]
-        self.state.player_pos[self.to_move] = (y + action.dy, x + action.dx)
+        y, x = self.state.player_pos[self._to_move]
+        self.state.player_pos[self._to_move] = (y + action.dy, x + action.dx)
 
     def _execute_wall_action(self, action: WallAction) -> None:
         """
         Apply a wall placement for the current player.
         """
         self.state.execute_wall_action(action=action)
-        self.state.walls_left[self.to_move] -= 1
+        self.state.walls_left[self._to_move] -= 1
 
     def use_action(self, action: Action) -> None:
         """
-        Apply the given action to the current state.
+        Apply the given action to the current state. Each Action subclass
+        knows how to apply itself, so no isinstance dispatch is needed here.
         """
-        if isinstance(action, (MovementAction, BlockedMovementAction)):
-            self._execute_player_movement(action=action)
-        elif isinstance(action, WallAction):
-            self._execute_wall_action(action=action)
-        else:
+        apply = getattr(action, "apply", None)
+        if apply is None:
             raise ValueError(f"Unknown action type: {type(action)}")
+        apply(self)
 
     # ---------- Bot interaction / game loop ----------
 
@@ -220,10 +209,13 @@ class QuoridorEnv:
         Run bot.select_move with a timeout. Returns (ok, action).
         If timed out or crashed, returns (False, None).
         """
+        # Per-call shallow copies: bots must never see the engine's own
+        # action objects (wall actions alias a process-wide catalog, and a
+        # buggy bot mutating them would poison every later game)
         future = executor.submit(
             bot.select_move,
-            state=deepcopy(self.state),
-            legal_actions=deepcopy(legal_actions),
+            state=self.state.copy(),
+            legal_actions=[copy(action) for action in legal_actions],
         )
         try:
             return True, future.result(timeout=move_timeout)
@@ -254,28 +246,55 @@ class QuoridorEnv:
         """
         actions = self.get_all_legal_actions()
 
-        ok, chosen_action = self._timed_select_move(
-            bot_to_move,
-            legal_actions=actions,
-            executor=executor,
-            move_timeout=move_timeout,
-        )
+        # Deterministic bots answer the same position the same way, so a
+        # previously recorded choice can be replayed without calling them
+        cache_key = None
+        engine_action = None
+        if bot_to_move.deterministic:
+            # Key on the bot object itself (identity hash): unlike id(), the
+            # cache entry then keeps the bot alive, so a recycled id of a
+            # garbage-collected bot can never replay someone else's choices
+            cache_key = (bot_to_move, self._to_move, self.state.state_key())
+            cached_idx = self._move_cache.get(cache_key)
+            if cached_idx is not None:
+                engine_action = next(
+                    (a for a in actions if a.idx == cached_idx), None
+                )
 
-        if not ok:
-            print(
-                f"Player {bot_to_move.player_id} timed out or crashed. "
-                f"Player {bot_other.player_id} wins."
+        if engine_action is None:
+            ok, chosen_action = self._timed_select_move(
+                bot_to_move,
+                legal_actions=actions,
+                executor=executor,
+                move_timeout=move_timeout,
             )
-            self.running = False
-            return bot_other.player_id
 
-        if chosen_action not in actions:
-            print(f"Illegal action chosen by Player {bot_to_move.player_id}:")
-            print(chosen_action)
-            self.running = False
-            return bot_other.player_id
+            if not ok:
+                print(
+                    f"Player {bot_to_move.player_id} timed out or crashed. "
+                    f"Player {bot_other.player_id} wins."
+                )
+                self.running = False
+                return bot_other.player_id
+
+            # Validate against the engine's own action with the same idx: one
+            # dict lookup plus one equality check instead of a linear scan
+            # over the whole action list
+            engine_action = (
+                {a.idx: a for a in actions}.get(getattr(chosen_action, "idx", None))
+            )
+            if engine_action is None or engine_action != chosen_action:
+                print(f"Illegal action chosen by Player {bot_to_move.player_id}:")
+                print(chosen_action)
+                self.running = False
+                return bot_other.player_id
 
-        self.use_action(chosen_action)
+            if cache_key is not None:
+                if len(self._move_cache) >= self.MOVE_CACHE_MAX:
+                    self._move_cache.clear()
+                self._move_cache[cache_key] = engine_action.idx
+
+        self.use_action(engine_action)
 
         if visualise:
             self._draw()
@@ -292,40 +311,59 @@ class QuoridorEnv:
         player_2: QuoridorBot,
         visualise: bool = True,
         move_timeout: float = 2.0,
+        executor: ThreadPoolExecutor | None = None,
     ) -> str:
         """
         Run a full game between two bots and return the winner's player_id.
+
+        An already-running `executor` can be passed in to avoid spawning and
+        tearing down a thread pool per game (a tournament plays hundreds of
+        games); when omitted, a pool is created for just this game.
         """
         self.reset()
         if visualise:
             self._draw()
 
+        if executor is not None:
+            return self._run_game(player_1, player_2, executor, move_timeout, visualise)
+
         with ThreadPoolExecutor(max_workers=2) as executor:
-            while self.running:
-                # ---------- Player 1 ----------
-                self.to_move = self.s.P1
-                winner = self._play_single_turn(
-                    bot_to_move=player_1,
-                    bot_other=player_2,
-                    executor=executor,
-                    move_timeout=move_timeout,
-                    visualise=visualise,
-                )
-                if winner is not None:
-                    return winner
-
-                # ---------- Player 2 ----------
-                self.to_move = self.s.P2
-                winner = self._play_single_turn(
-                    bot_to_move=player_2,
-                    bot_other=player_1,
-                    executor=executor,
-                    move_timeout=move_timeout,
-                    visualise=visualise,
-                )
-                if winner is not None:
-                    return winner
+            return self._run_game(player_1, player_2, executor, move_timeout, visualise)
+
+    def _run_game(
+        self,
+        player_1: QuoridorBot,
+        player_2: QuoridorBot,
+        executor: ThreadPoolExecutor,
+        move_timeout: float,
+        visualise: bool,
+    ) -> str:
+        """Turn loop of game_loop, factored out so the executor can come from outside."""
+        while self.running:
+            # ---------- Player 1 ----------
+            self.to_move = self.s.P1
+            winner = self._play_single_turn(
+                bot_to_move=player_1,
+                bot_other=player_2,
+                executor=executor,
+                move_timeout=move_timeout,
+                visualise=visualise,
+            )
+            if winner is not None:
+                return winner
+
+            # ---------- Player 2 ----------
+            self.to_move = self.s.P2
+            winner = self._play_single_turn(
+                bot_to_move=player_2,
+                bot_other=player_1,
+                executor=executor,
+                move_timeout=move_timeout,
+                visualise=visualise,
+            )
+            if winner is not None:
+                return winner
 
-                self.turn += 1
-                if self.turn >= self.s.MAX_MOVES:
-                    return -1
+            self.turn += 1
+            if self.turn >= self.s.MAX_MOVES:
+                return -1
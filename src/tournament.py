@@ -3,8 +3,9 @@ import inspect
 import os
 import sys
 from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from types import ModuleType
-from typing import Dict, List, Type, get_type_hints, Optional
+from typing import Dict, List, Type, Optional
 
 import numpy as np
 import pandas as pd
@@ -91,19 +92,24 @@ def is_valid_bot(bot_cls: Type[QuoridorBot]) -> bool:
             print(f"{bot_cls.__name__} is missing method: {method_name}")
             return False
 
-        # Try to inspect type hints; if none, we don't fail hard
-        try:
-            hints = get_type_hints(method)
-        except Exception:
-            hints = {}
-
-        actual_ret = hints.get("return")
+        # Read the raw return annotation instead of get_type_hints: the
+        # latter resolves every forward reference in the method's module
+        # globals, which stalls for seconds when a bot imports heavy ML
+        # libraries. Annotations may be plain strings (postponed
+        # evaluation), so compare by name; if absent, we don't fail hard.
+        actual_ret = getattr(method, "__annotations__", {}).get("return")
         if actual_ret is not None and actual_ret is not expected_return:
-            print(
-                f"{bot_cls.__name__}.{method_name}() should return "
-                f"{expected_return}, found {actual_ret}"
+            ret_name = (
+                actual_ret
+                if isinstance(actual_ret, str)
+                else getattr(actual_ret, "__name__", repr(actual_ret))
             )
-            return False
+            if ret_name != expected_return.__name__:
+                print(
+                    f"{bot_cls.__name__}.{method_name}() should return "
+                    f"{expected_return}, found {actual_ret}"
+                )
+                return False
 
         if method_name == "select_move":
             # Check parameter names: (self, state, legal_actions)
@@ -119,21 +125,100 @@ def is_valid_bot(bot_cls: Type[QuoridorBot]) -> bool:
     return True
 
 
+def run_matches(
+    bot_1_cls: Type[QuoridorBot],
+    bot_2_cls: Type[QuoridorBot],
+    rounds: int,
+    visualise: bool,
+    executor: Optional[ThreadPoolExecutor] = None,
+) -> float:
+    """
+    Play `rounds` games between two bot classes, alternating who starts.
+    Returns:
+        float: win rate (0-1) of bot_1.
+    """
+    env = QuoridorEnv()
+    wins_bot1 = 0
+
+    # Create bot instances once and reuse, calling reset() before each game
+    bot1 = bot_1_cls(0)
+    bot2 = bot_2_cls(1)
+
+    for i in range(rounds):
+        bot1.reset()
+        bot2.reset()
+        env.reset()
+
+        # Alternate who starts
+        if i % 2 == 0:
+            p1, p2 = bot1, bot2
+            bot1_id = 0
+        else:
+            p1, p2 = bot2, bot1
+            bot1_id = 1  # bot_1 plays as player 2 here
+
+        winner_player_id: int = env.game_loop(
+            p1, p2, visualise=visualise, executor=executor
+        )
+
+        if winner_player_id == bot1_id:
+            wins_bot1 += 1
+
+        if winner_player_id == -1:  # draw because of timeout (probably random moves)
+            wins_bot1 += 0.5
+
+    return wins_bot1 / rounds
+
+
+def _play_matchup_worker(
+    path_a: str, module_a: str, path_b: str, module_b: str, rounds: int
+) -> float:
+    """
+    Matchup entry point for worker processes. Dynamically loaded bot classes
+    do not pickle, so each worker re-loads them from their file paths and
+    plays the matchup with its own thread pool; visualisation is off here.
+    """
+    bot_1_cls = load_bot_class(path_a, module_name=module_a)
+    bot_2_cls = load_bot_class(path_b, module_name=module_b)
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="bot") as executor:
+        return run_matches(
+            bot_1_cls, bot_2_cls, rounds, visualise=False, executor=executor
+        )
+
+
 class QuoridorTournament:
-    def __init__(self, bot_folder: str, result_csv: str, visualise: bool) -> None:
+    def __init__(
+        self, bot_folder: str, result_csv: str, visualise: bool, jobs: int = 1
+    ) -> None:
         self.settings = TournamentConfig()
 
         self.bot_folder = bot_folder
         self.result_csv = result_csv
+        # Per-match results are appended here as they come in; the CSV
+        # itself is only written when the tournament finishes
+        self.result_log = result_csv + ".log"
         self.rounds = self.settings.rounds
         self.visualise = visualise
+        # Matchups are independent, so they can be fanned out over worker
+        # processes; visualisation only makes sense sequentially
+        self.jobs = max(1, jobs)
+        if self.jobs > 1 and visualise:
+            print("Parallel matchups cannot be visualised; ignoring --visualise.")
+            self.visualise = False
 
         if self.rounds % 2 != 0:
             # Uneven rounds makes first-move advantage skewed
             raise ValueError("Round count must be even to make outcome fair.")
 
-        # Maps bot name -> bot class (subclass of QuoridorBot)
+        # Maps bot name -> bot class (subclass of QuoridorBot), and
+        # bot name -> (file path, module name) so worker processes can
+        # re-load the class themselves
         self.bot_classes: Dict[str, Type[QuoridorBot]] = {}
+        self.bot_files: Dict[str, tuple] = {}
+
+        # One thread pool for every game in the tournament; spawning and
+        # tearing down a pool per game adds up over hundreds of games.
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="bot")
 
         # Winrate matrix (rows/cols = bot names)
         self.scores: Optional[pd.DataFrame] = None
@@ -163,13 +248,38 @@ class QuoridorTournament:
 
             # Reindex to current bot order (both rows and columns)
             df = df.reindex(index=bot_names, columns=bot_names)
-            self.scores = df
             print(f"Loaded existing scores from {path}")
         else:
             # Fresh table: all matchups unplayed
-            self.scores = pd.DataFrame(np.nan, index=bot_names, columns=bot_names)
+            df = pd.DataFrame(np.nan, index=bot_names, columns=bot_names)
             print(f"Created new scores table for {len(bot_names)} bots.")
 
+        self._replay_result_log(df)
+        self.scores = df
+
+    def _replay_result_log(self, df: pd.DataFrame) -> None:
+        """
+        Fold results from the append-only match log into the score table, so
+        an interrupted tournament resumes without replaying finished matchups
+        even though the CSV is only written on completion.
+        """
+        if not os.path.exists(self.result_log):
+            return
+
+        replayed = 0
+        with open(self.result_log) as log:
+            for line in log:
+                parts = line.strip().split(",")
+                if len(parts) != 3:
+                    continue
+                bot_a, bot_b, winrate = parts
+                if bot_a in df.index and bot_b in df.index:
+                    df.at[bot_a, bot_b] = float(winrate)
+                    df.at[bot_b, bot_a] = 1.0 - float(winrate)
+                    replayed += 1
+        if replayed:
+            print(f"Replayed {replayed} results from {self.result_log}")
+
     # ----- Match playing -----
 
     def n_matches(
@@ -180,37 +290,13 @@ class QuoridorTournament:
         Returns:
             float: win rate (0–1) of bot_1.
         """
-        env = QuoridorEnv()
-        wins_bot1 = 0
-
-        # Create bot instances once and reuse, calling reset() before each game
-        bot1 = bot_1_cls(0)
-        bot2 = bot_2_cls(1)
-
-        for i in range(self.rounds):
-            bot1.reset()
-            bot2.reset()
-            env.reset()
-
-            # Alternate who starts
-            if i % 2 == 0:
-                p1, p2 = bot1, bot2
-                bot1_id = 0
-            else:
-                p1, p2 = bot2, bot1
-                bot1_id = 1  # bot_1 plays as player 2 here
-
-            winner_player_id: int = env.game_loop(p1, p2, visualise=self.visualise)
-
-            if winner_player_id == bot1_id:
-                wins_bot1 += 1
-
-            if (
-                winner_player_id == -1
-            ):  # draw because of timeout (probably random moves)
-                wins_bot1 += 0.5
-
-        return wins_bot1 / self.rounds
+        return run_matches(
+            bot_1_cls,
+            bot_2_cls,
+            rounds=self.rounds,
+            visualise=self.visualise,
+            executor=self._executor,
+        )
 
     def run_all_rounds(self) -> None:
         """
@@ -227,34 +313,71 @@ class QuoridorTournament:
             )
 
         bot_names = list(self.scores.index)
+        n = len(bot_names)
+
+        # Work on a positional NumPy mirror of the table: the upper-triangle
+        # walk then skips pandas label lookups per cell, and the CSV is
+        # written once at the end instead of fully rewritten per matchup.
+        score_arr = self.scores.to_numpy(copy=True)
+
+        pending = [
+            (i, j)
+            for i in range(n)
+            for j in range(i + 1, n)
+            # Skip already played (not NaN) matchups
+            if np.isnan(score_arr[i, j])
+        ]
+
+        def record(i: int, j: int, row_bot_winrate: float, log) -> None:
+            row_bot, col_bot = bot_names[i], bot_names[j]
+            print(
+                f"{row_bot} vs {col_bot}: "
+                f"{row_bot_winrate:.2%} - {1.0 - row_bot_winrate:.2%}"
+            )
+            score_arr[i, j] = row_bot_winrate
+            score_arr[j, i] = 1.0 - row_bot_winrate
+            log.write(f"{row_bot},{col_bot},{row_bot_winrate}\n")
+
+        # Line-buffered so each result hits disk as it is produced
+        with open(self.result_log, "a", buffering=1) as log:
+            if self.jobs > 1:
+                with ProcessPoolExecutor(max_workers=self.jobs) as pool:
+                    futures = {}
+                    for i, j in pending:
+                        path_a, module_a = self.bot_files[bot_names[i]]
+                        path_b, module_b = self.bot_files[bot_names[j]]
+                        future = pool.submit(
+                            _play_matchup_worker,
+                            path_a,
+                            module_a,
+                            path_b,
+                            module_b,
+                            self.rounds,
+                        )
+                        futures[future] = (i, j)
+                    for future in as_completed(futures):
+                        i, j = futures[future]
+                        record(i, j, future.result(), log)
+            else:
+                for i, j in pending:
+                    winrate = self.n_matches(
+                        bot_1_cls=self.bot_classes[bot_names[i]],
+                        bot_2_cls=self.bot_classes[bot_names[j]],
+                    )
+                    record(i, j, winrate, log)
 
-        for i, row_bot in enumerate(bot_names):
-            for j, col_bot in enumerate(bot_names):
-                # Skip same-bot matchup or lower triangle (matrix is symmetric)
-                if i >= j:
-                    continue
-
-                value = self.scores.at[row_bot, col_bot]
-
-                # If already played (not NaN), skip
-                if pd.notna(value):
-                    continue
-
-                row_bot_winrate = self.n_matches(
-                    bot_1_cls=self.bot_classes[row_bot],
-                    bot_2_cls=self.bot_classes[col_bot],
-                )
-                col_bot_winrate = 1.0 - row_bot_winrate
-
-                print(
-                    f"{row_bot} vs {col_bot}: "
-                    f"{row_bot_winrate:.2%} - {col_bot_winrate:.2%}"
-                )
+        self.scores = pd.DataFrame(score_arr, index=bot_names, columns=bot_names)
+        self.scores.to_csv(self.result_csv)
 
-                self.scores.at[row_bot, col_bot] = row_bot_winrate
-                self.scores.at[col_bot, row_bot] = col_bot_winrate
+        # Every logged result is now in the CSV, so the log has served its
+        # purpose; dropping it keeps a later run (e.g. after deleting the
+        # CSV to redo the tournament) from resurrecting these results.
+        if os.path.exists(self.result_log):
+            os.remove(self.result_log)
 
-                self.scores.to_csv(self.result_csv)
+    def shutdown(self) -> None:
+        """Release the shared bot executor once the tournament is done."""
+        self._executor.shutdown(wait=True)
 
     # ----- Bot discovery & validation -----
 
@@ -283,21 +406,26 @@ class QuoridorTournament:
             folder_name = entry.name
             folder_path = entry.path
 
-            # Find all .py files in the student's folder
-            py_files = [
-                f
-                for f in os.listdir(folder_path)
-                if f.endswith(".py") and not f.startswith("__")
-            ]
-
-            if not py_files:
+            # Walk the student's folder with scandir as well: it caches the
+            # stat results, so the is_file checks cost no extra syscalls
+            with os.scandir(folder_path) as folder_it:
+                py_entries = [
+                    f
+                    for f in folder_it
+                    if f.is_file()
+                    and f.name.endswith(".py")
+                    and not f.name.startswith("__")
+                ]
+
+            if not py_entries:
                 # Nothing to load from this folder
                 continue
 
             bot_registered_for_folder = False
 
-            for file_name in py_files:
-                full_path = os.path.join(folder_path, file_name)
+            for file_entry in py_entries:
+                file_name = file_entry.name
+                full_path = file_entry.path
 
                 # Unique module name to avoid collisions in sys.modules
                 module_base = os.path.splitext(file_name)[0]
@@ -326,6 +454,7 @@ class QuoridorTournament:
                     continue
 
                 self.bot_classes[bot_label] = bot_cls
+                self.bot_files[bot_label] = (full_path, module_name)
                 bot_registered_for_folder = True
                 print(f"Registered bot '{bot_label}' from {folder_name}/{file_name}")
 
@@ -353,6 +482,14 @@ if __name__ == "__main__":
     parser.add_argument(
         "--visualise", "-v", action="store_true", help="Visualise games in the console."
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Play matchups in parallel across this many processes "
+        "(disables visualisation).",
+    )
 
     args = parser.parse_args()
 
@@ -360,6 +497,7 @@ if __name__ == "__main__":
         bot_folder=args.src_folder,
         result_csv=args.result_csv,
         visualise=args.visualise,
+        jobs=args.jobs,
     )
 
     tournament.read_and_validate_bots()
@@ -367,5 +505,8 @@ if __name__ == "__main__":
         print("No valid bots found. Exiting.")
         sys.exit(1)
 
-    tournament.load_or_create_scores()
-    tournament.run_all_rounds()
+    try:
+        tournament.load_or_create_scores()
+        tournament.run_all_rounds()
+    finally:
+        tournament.shutdown()